@@ -97,13 +97,15 @@ class GraphTransformer:
             partitioner = getattr(node, 'partitioner')
             if partitioner:
                 for part in node.part_config:
+                    synchronizer_name = part.WhichOneof('synchronizer')
                     self._synchronizers[part.var_name] = \
-                        Synchronizer.create(part.WhichOneof('synchronizer'),
-                                            getattr(part, part.WhichOneof('synchronizer')))
+                        Synchronizer.create(synchronizer_name,
+                                            getattr(part, synchronizer_name))
             else:
+                synchronizer_name = node.WhichOneof('synchronizer')
                 self._synchronizers[node.var_name] = \
-                    Synchronizer.create(node.WhichOneof('synchronizer'),
-                                        getattr(node, node.WhichOneof('synchronizer')))
+                    Synchronizer.create(synchronizer_name,
+                                        getattr(node, synchronizer_name))
 
         config = self._strategy.graph_config.replicas
         replica_devices = {device_spec.DeviceSpecV2.from_string(s) for s in config}
@@ -13,8 +13,8 @@
 # limitations under the License.
 
 """Variable Partitioner."""
-import collections
 import re
+from collections import defaultdict
 
 from google.protobuf.pyext._message import RepeatedScalarContainer
 from tensorflow.core.framework import graph_pb2
@@ -38,6 +38,8 @@ from autodist.utils import logging
 class PartitionerConfig():
     """Helper class to conveniently convert between partition list and partition string."""
 
+    __slots__ = ('_partition_list', '_partition_str')
+
     def __init__(self, partition_list=None, partition_str=None):
         if partition_list:
             self._partition_list = partition_list
@@ -233,7 +235,7 @@ class VariablePartitioner(Kernel):
         """Group the ops within the same partition."""
         op_names = [v.op.name for v in vars_to_group]
         partition_pattern = r"part_?\d+"
-        group = collections.defaultdict(list)
+        group = defaultdict(list)
         for name in op_names:
             name_list = name.split("/")
             # the ops in the optimizer
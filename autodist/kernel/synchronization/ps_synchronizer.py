@@ -670,6 +670,10 @@ class PSGradientTaskAssigner:
         self._agg_grad_descendant_ops = traverse(self._agg_grad_ops, end_ops=self._apply_grad_ops)
         self._ancestors_diff_descendants = self._apply_grad_ancestor_ops.difference(self._agg_grad_descendant_ops)
 
+        # Consumer lists are re-read whenever an op is revisited during the
+        # bi-directional traversals below, so build them lazily once per op.
+        self._consumers_cache = {}
+
         logging.debug(f"apply_grad_ancestor_ops: {len(self._apply_grad_ancestor_ops)}")
         logging.debug(f"agg_grad_descendant_ops: {len(self._agg_grad_descendant_ops)}")
         logging.debug(f"ancestors diff descendants: {len(self._ancestors_diff_descendants)}")
@@ -683,11 +687,18 @@ class PSGradientTaskAssigner:
         fn = partial(self.__assign_backward, end_ops=self._agg_grad_ops)
         traverse(self._apply_grad_ops, self._agg_grad_ops, neighbors_fn=fn)
 
+    def _get_consumers(self, op):
+        """Memoized `get_consumers` for the traversals, which revisit ops whose references are not ready yet."""
+        consumers = self._consumers_cache.get(op)
+        if consumers is None:
+            consumers = self._consumers_cache[op] = get_consumers(op)
+        return consumers
+
     def __assign_forward(self, curr_op, end_ops=None):
         """Get children of and assign a task for `curr_op`. To be used as the `neighbors_fn` for `traverse`."""
         end_ops = end_ops or set()
         if curr_op in self._op_to_task and curr_op not in end_ops:
-            return [consumer for consumer in get_consumers(curr_op) if consumer in self._apply_grad_ancestor_ops]
+            return [consumer for consumer in self._get_consumers(curr_op) if consumer in self._apply_grad_ancestor_ops]
 
         placement_reference_ops = {input_tensor.op for input_tensor in curr_op.inputs}. \
             difference(self._ancestors_diff_descendants)
@@ -700,7 +711,7 @@ class PSGradientTaskAssigner:
         self.__assign_task(curr_op, placement_reference_ops)
 
         if curr_op not in end_ops:
-            return [consumer for consumer in get_consumers(curr_op) if consumer in self._apply_grad_ancestor_ops]
+            return [consumer for consumer in self._get_consumers(curr_op) if consumer in self._apply_grad_ancestor_ops]
 
         return []
 
@@ -710,7 +721,8 @@ class PSGradientTaskAssigner:
         if curr_op in self._op_to_task and curr_op not in end_ops:
             return [input_tensor.op for input_tensor in curr_op.inputs]
 
-        placement_reference_ops = set(get_consumers(curr_op)).intersection(self._apply_grad_ancestor_ops)
+        placement_reference_ops = {consumer for consumer in self._get_consumers(curr_op)
+                                   if consumer in self._apply_grad_ancestor_ops}
 
         if not all(ref_op in self._op_to_task for ref_op in placement_reference_ops):
             # At least one of `placement_reference_ops` doesn't have a task assigned yet,
@@ -66,9 +66,8 @@ class ResourceSpec:
         self.__devices = dict()
         self.__nodes = None
         self.__cpu_devices = None
-        self.__num_cpus = None
         self.__gpu_devices = None
-        self.__num_gpus = None
+        self.__node_devices = dict()
         self.__chief_address = None
         self.__ssh_config_map = dict()
         self.__ssh_group = dict()
@@ -104,9 +103,7 @@ class ResourceSpec:
     @property
     def num_cpus(self):
         """Number of all cpu devices."""
-        if not self.__num_cpus:
-            self.__num_cpus = len(self.cpu_devices)
-        return self.__num_cpus
+        return len(self.cpu_devices)
 
     @property
     def gpu_devices(self):
@@ -118,25 +115,27 @@ class ResourceSpec:
     @property
     def node_gpu_devices(self):
         """Node_address-to-device_string mapping of all gpu devices."""
-        _gpu_devices = dict()
-        for device in self.gpu_devices:
-            _gpu_devices.setdefault(device[0].split(':')[0], []).append(device[0])
-        return _gpu_devices
+        if DeviceType.GPU not in self.__node_devices:
+            _gpu_devices = dict()
+            for device in self.gpu_devices:
+                _gpu_devices.setdefault(device[0].split(':')[0], []).append(device[0])
+            self.__node_devices[DeviceType.GPU] = _gpu_devices
+        return self.__node_devices[DeviceType.GPU]
 
     @property
     def node_cpu_devices(self):
-        """Node_address-to-device_string mapping of all cpu devices."""        
-        _cpu_devices = dict()
-        for device in self.cpu_devices:
-            _cpu_devices.setdefault(device[0].split(':')[0], []).append(device[0])
-        return _cpu_devices
+        """Node_address-to-device_string mapping of all cpu devices."""
+        if DeviceType.CPU not in self.__node_devices:
+            _cpu_devices = dict()
+            for device in self.cpu_devices:
+                _cpu_devices.setdefault(device[0].split(':')[0], []).append(device[0])
+            self.__node_devices[DeviceType.CPU] = _cpu_devices
+        return self.__node_devices[DeviceType.CPU]
 
     @property
     def num_gpus(self):
         """Number of all gpu devices."""
-        if not self.__num_gpus:
-            self.__num_gpus = len(self.gpu_devices)
-        return self.__num_gpus
+        return len(self.gpu_devices)
 
     @property
     def ssh_config_map(self):
@@ -218,6 +217,8 @@ class ResourceSpec:
 class DeviceSpec:
     """Device specification."""
 
+    __slots__ = ('host_address', 'device_type', 'device_index', 'host_device')
+
     def __init__(
             self,
             host_address,
@@ -49,22 +49,18 @@ class AllReduce(StrategyBuilder):
         expr = Strategy()
 
         # get each variable, generate variable synchronizer config
-        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
-        for k, v in resource_spec.node_cpu_devices.items():
-            if k not in resource_spec.node_gpu_devices:
-                expr.graph_config.replicas.extend(v)    
+        self._extend_replicas(expr, resource_spec)
 
         # find all variables
         variables = graph_item.get_trainable_variables()
 
         # Mark each variable to be synchronized with allreduce
-        for i, var in enumerate(variables):
-            group_id = i // self.chunk_size
-            node_config = self._gen_all_reduce_node_config(var.name, 
-                                                           group=group_id,
-                                                           all_reduce_spec=self.all_reduce_spec,
-                                                           compressor=self.compressor)
-            expr.node_config.append(node_config)
+        node_config = [self._gen_all_reduce_node_config(var.name,
+                                                        group=i // self.chunk_size,
+                                                        all_reduce_spec=self.all_reduce_spec,
+                                                        compressor=self.compressor)
+                       for i, var in enumerate(variables)]
+        expr.node_config.extend(node_config)
 
         return expr
 
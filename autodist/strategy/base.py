@@ -116,6 +116,21 @@ class StrategyBuilder(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _extend_replicas(expr, resource_spec):
+        """
+        Replicate the graph onto every GPU device, and onto the CPU of any node without GPUs.
+
+        Args:
+            expr (Strategy): the strategy whose graph config to fill.
+            resource_spec (ResourceSpec): resource information.
+        """
+        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
+        node_gpu_devices = resource_spec.node_gpu_devices
+        for k, v in resource_spec.node_cpu_devices.items():
+            if k not in node_gpu_devices:
+                expr.graph_config.replicas.extend(v)
+
 
 class StrategyCompiler:
     """
@@ -128,41 +143,38 @@ class StrategyCompiler:
     def __init__(self, graph_item):
         self._graph_item = graph_item
         self._device_resolver = None
+        self._resolved_destinations = {}
 
     def set_device_resolver(self, resolver):
         """Add a device resolver to resolve devices in the strategy."""
         self._device_resolver = resolver
+        self._resolved_destinations = {}
         return self
 
     def _resolve_reduction_destination(self, node):
         synchronizer = getattr(node, node.WhichOneof('synchronizer'))
         if hasattr(synchronizer, 'reduction_destination'):
             d = synchronizer.reduction_destination
-            synchronizer.reduction_destination = self._device_resolver(d)
+            resolved = self._resolved_destinations.get(d)
+            if resolved is None:
+                resolved = self._resolved_destinations[d] = self._device_resolver(d)
+            synchronizer.reduction_destination = resolved
 
-    def _resolve_devices(self, strategy):
+    def compile(self, strategy):
+        """Compile the strategy."""
         s = strategy.copy()
-        for n in s.node_config:
-            if n.partitioner:
-                # meaning this var is going to be partitioned
-                for part in n.part_config:
-                    self._resolve_reduction_destination(part)
-            else:
-                self._resolve_reduction_destination(n)
-        d = s.graph_config.replicas
-        s.graph_config.replicas[:] = self._device_resolver(d)
-        return s
-
-    def _prune_nodes(self, strategy):
         # Prune the nodes without stateful updates
-        s = strategy.copy()
+        grad_info = self._graph_item.var_op_name_to_grad_info
         s.node_config = [n for n in strategy.node_config
-                         if get_op_name(n.var_name) in self._graph_item.var_op_name_to_grad_info]
-        return s
-
-    def compile(self, strategy):
-        """Compile the strategy."""
-        strategy = self._prune_nodes(strategy)
+                         if get_op_name(n.var_name) in grad_info]
         if self._device_resolver:
-            strategy = self._resolve_devices(strategy)
-        return strategy
+            for n in s.node_config:
+                if n.partitioner:
+                    # meaning this var is going to be partitioned
+                    for part in n.part_config:
+                        self._resolve_reduction_destination(part)
+                else:
+                    self._resolve_reduction_destination(n)
+            d = s.graph_config.replicas
+            s.graph_config.replicas[:] = self._device_resolver(d)
+        return s
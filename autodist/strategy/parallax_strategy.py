@@ -40,12 +40,9 @@ class Parallax(PSLoadBalancing, AllReduce):
         expr = Strategy()
 
         # For each variable, generate variable synchronizer config
-        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
-        for k, v in resource_spec.node_cpu_devices.items():
-            if k not in resource_spec.node_gpu_devices:
-                expr.graph_config.replicas.extend(v)  
+        self._extend_replicas(expr, resource_spec)
         reduction_device_names = [k for k, _ in resource_spec.cpu_devices]
-        self.loads = {ps: 0.0 for ps in reduction_device_names}
+        self._init_loads(reduction_device_names)
 
         # Generate node config
         node_config = []
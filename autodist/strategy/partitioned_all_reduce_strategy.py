@@ -51,20 +51,19 @@ class PartitionedAR(StrategyBuilder):
         expr = Strategy()
 
         # data-parallel graph replication first
-        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
-        for k, v in resource_spec.node_cpu_devices.items():
-            if k not in resource_spec.node_gpu_devices:
-                expr.graph_config.replicas.extend(v)
+        self._extend_replicas(expr, resource_spec)
 
         # find all variables
         variables = graph_item.trainable_var_op_to_var.values()
 
         # Mark each variable to be synchronized with allreduce
+        node_config = []
         var_counter = 0
         for var in variables:
-            node_config, num_shards = self._gen_node_config(var, var_counter)
+            config, num_shards = self._gen_node_config(var, var_counter)
             var_counter += num_shards
-            expr.node_config.append(node_config)
+            node_config.append(config)
+        expr.node_config.extend(node_config)
 
         return expr
 
@@ -96,35 +95,36 @@ class PartitionedAR(StrategyBuilder):
         # num_parts > 1 means the variable will be partitioned
         # generate the partitioner config
         shape = var.initial_value.shape
-        partition_list = [1] * len(var.initial_value.shape)
+        partition_list = [1] * len(shape)
         partition_axis = 0
         partition_list[partition_axis] = min(num_shards, shape.dims[partition_axis].value)
         num_parts = np.prod(partition_list)
         pc = PartitionerConfig(partition_list=partition_list)
         node.partitioner = pc.partition_str
+        var_op_name = get_op_name(var.name)
         for i in range(num_parts):
-            part = strategy_pb2.Strategy.Node()
+            part = node.part_config.add()
 
             # If part var_name is inconsistent with what TF will create, partitioner kernel will correct it later.
             # Here let's just make it consistent
-            part.var_name = '{}/part_{}:0'.format(get_op_name(var.name), i)
+            part.var_name = '{}/part_{}:0'.format(var_op_name, i)
             part.AllReduceSynchronizer.spec = synchronizers_pb2.AllReduceSynchronizer.Spec.Value("AUTO")
             part.AllReduceSynchronizer.compressor = \
                 synchronizers_pb2.AllReduceSynchronizer.Compressor.Value("NoneCompressor")
             # part.AllReduceSynchronizer.compressor = \
             #     synchronizers_pb2.AllReduceSynchronizer.Compressor.Value("PowerSGDCompressor")                
             part.AllReduceSynchronizer.group = (var_counter + i) // self.chunk_size
-            node.part_config.extend([part])
         return node, num_shards
 
     @staticmethod
     def get_num_shards(var):
         """Gets the minimum number of shards for a variable."""
-        if not var.initial_value.shape.ndims:
+        shape = var.initial_value.shape
+        if not shape.ndims:
             return 1
 
-        n = int(var.initial_value.shape[0])
-        for i in range(2, n):
+        n = int(shape[0])
+        for i in range(2, int(n ** 0.5) + 1):
             if n % i == 0:
                 return i
         return n
@@ -14,6 +14,8 @@
 
 """PS Load Balancing StrategyBuilder."""
 
+import heapq
+
 from tensorflow.python.framework import tensor_shape
 
 from autodist.strategy.base import Strategy, StrategyBuilder
@@ -37,22 +39,32 @@ class PSLoadBalancing(StrategyBuilder):
         if self._staleness > 0:
             assert self._sync, 'If staleness is positive, sync has to be set true.'
         self.loads = {}
+        self._load_heap = []
+        self._var_sizes = {}
         super().__init__()
 
+    def _init_loads(self, reduction_device_names):
+        """Reset the load balancer state for a new build."""
+        self.loads = {ps: 0.0 for ps in reduction_device_names}
+        self._load_heap = [(0.0, ps) for ps in reduction_device_names]
+        heapq.heapify(self._load_heap)
+
+    def _batch_var_sizes(self, variables):
+        """Compute the byte sizes of all variables in one pass, ahead of placement."""
+        self._var_sizes = {var.name: cached_byte_size_load_fn(var) for var in variables}
+
     def build(self, graph_item, resource_spec):
         """Generate the Strategy."""
         expr = Strategy()
 
         # get each variable, generate variable synchronizer config
-        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
-        for k, v in resource_spec.node_cpu_devices.items():
-            if k not in resource_spec.node_gpu_devices:
-                expr.graph_config.replicas.extend(v)
+        self._extend_replicas(expr, resource_spec)
 
         # find all variables
         variables = graph_item.get_trainable_variables()
         reduction_device_names = [k for k, _ in resource_spec.cpu_devices]
-        self.loads = {ps: 0.0 for ps in reduction_device_names}
+        self._init_loads(reduction_device_names)
+        self._batch_var_sizes(variables)
 
         # Mark each variable to be synchronized with a Parameter Server
         node_config = [self._gen_ps_node_config(var, self._local_proxy_variable, self._sync, self._staleness)
@@ -71,8 +83,13 @@ class PSLoadBalancing(StrategyBuilder):
         Returns:
             strategy_pb2.Strategy.Node: the config for the node.
         """
-        min_ps = min(self.loads, key=self.loads.get)
-        self.loads[min_ps] += byte_size_load_fn(var)
+        load, min_ps = heapq.heappop(self._load_heap)
+        size = self._var_sizes.get(var.name)
+        if size is None:
+            size = cached_byte_size_load_fn(var)
+        load += size
+        self.loads[min_ps] = load
+        heapq.heappush(self._load_heap, (load, min_ps))
 
         node = strategy_pb2.Strategy.Node()
         node.var_name = var.name
@@ -83,6 +100,35 @@ class PSLoadBalancing(StrategyBuilder):
         return node
 
 
+# Memoized byte sizes of variables, keyed by (id(var), var.name).
+# A builder can be invoked repeatedly on the same graph (e.g. when comparing
+# candidate strategies); a variable's byte size never changes, so later calls
+# can skip the tensor shape/dtype lookups entirely.
+_byte_size_cache = {}
+
+
+def clear_byte_size_cache():
+    """Clear the memoized per-variable byte sizes."""
+    _byte_size_cache.clear()
+
+
+def cached_byte_size_load_fn(var):
+    """
+    Memoized version of `byte_size_load_fn`.
+
+    Args:
+      var: An `Operation` with a single output, typically a "Variable" op.
+
+    Returns:
+      The number of bytes in the output `Tensor`.
+    """
+    key = (id(var), var.name)
+    size = _byte_size_cache.get(key)
+    if size is None:
+        size = _byte_size_cache[key] = byte_size_load_fn(var)
+    return size
+
+
 def byte_size_load_fn(op):
     """
     Load function that computes the byte size of a single-output `Operation`.
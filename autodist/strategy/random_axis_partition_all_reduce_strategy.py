@@ -52,36 +52,39 @@ class RandomAxisPartitionAR(StrategyBuilder):
         expr = Strategy()
 
         # data-parallel graph replication first
-        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
-        for k, v in resource_spec.node_cpu_devices.items():
-            if k not in resource_spec.node_gpu_devices:
-                expr.graph_config.replicas.extend(v)
+        self._extend_replicas(expr, resource_spec)
 
         # find all variables
-        variables = graph_item.trainable_var_op_to_var.values()
+        variables = list(graph_item.trainable_var_op_to_var.values())
+
+        # draw the axis randomness for all variables in one batched RNG call
+        axis_draws = np.random.random(len(variables))
 
         # Mark each variable to be synchronized with allreduce
+        node_config = []
         var_counter = 0
-        for var in variables:
+        for var, axis_draw in zip(variables, axis_draws):
             grad = graph_item.var_op_name_to_grad_info[var.op.name][0]
-            node_config, num_shards = self._gen_node_config(var, var_counter, grad)
+            config, num_shards = self._gen_node_config(var, var_counter, grad, axis_draw)
             var_counter += num_shards
-            expr.node_config.append(node_config)
+            node_config.append(config)
+        expr.node_config.extend(node_config)
 
         return expr
 
-    def _gen_node_config(self, var, var_counter, grad):
+    def _gen_node_config(self, var, var_counter, grad, axis_draw):
         """
         Creates a NodeConfig specifying partitioning and synchronization with AllReduce.
 
         Args:
             var (Variable): The variable to generate a config for.
             var_counter (int): variable counter for collective group assignment.
+            axis_draw (float): uniform [0, 1) draw used to pick the partition axis.
 
         Returns:
             Dict: the config dict for the node.
         """
-        num_shards, partition_axis = self.get_num_shards_and_axis(var, grad)
+        num_shards, partition_axis = self.get_num_shards_and_axis(var, grad, axis_draw)
         node = strategy_pb2.Strategy.Node()
         node.var_name = var.name
 
@@ -100,42 +103,46 @@ class RandomAxisPartitionAR(StrategyBuilder):
         partition_list[partition_axis] = num_shards
         pc = PartitionerConfig(partition_list=partition_list)
         node.partitioner = pc.partition_str
+        var_op_name = get_op_name(var.name)
         for i in range(num_shards):
-            part = strategy_pb2.Strategy.Node()
+            part = node.part_config.add()
 
             # If part var_name is inconsistent with what TF will create, partitioner kernel will correct it later.
             # Here let's just make it consistent
-            part.var_name = '{}/part_{}:0'.format(get_op_name(var.name), i)
+            part.var_name = '{}/part_{}:0'.format(var_op_name, i)
             part.AllReduceSynchronizer.spec = synchronizers_pb2.AllReduceSynchronizer.Spec.Value("AUTO")
             part.AllReduceSynchronizer.compressor = \
                 synchronizers_pb2.AllReduceSynchronizer.Compressor.Value("NoneCompressor")
             # part.AllReduceSynchronizer.compressor = \
             #     synchronizers_pb2.AllReduceSynchronizer.Compressor.Value("PowerSGDCompressor")
             part.AllReduceSynchronizer.group = (var_counter + i) // self.chunk_size
-            node.part_config.extend([part])
         return node, num_shards
 
     @staticmethod
-    def get_num_shards_and_axis(var, grad):
+    def get_num_shards_and_axis(var, grad, axis_draw):
         """Gets the minimum number of shards for a variable."""
-        if not var.initial_value.shape.ndims:
-            return 1, 0
-
-        shape_list = var.initial_value.shape.as_list()
-        non_one_dim = []
-        for i, dim in enumerate(shape_list):
-            if dim > 1:
-                non_one_dim.append(i)
-        if not non_one_dim:
+        shape = var.initial_value.shape
+        if not shape.ndims:
             return 1, 0
 
         if isinstance(grad, IndexedSlices):
+            # Sparse gradients are always partitioned along the first axis,
+            # so there is no need to scan for candidate axes.
             partition_axis = 0
+            n = int(shape[0])
         else:
-            idx = int(np.random.randint(0, len(non_one_dim)))
+            shape_list = shape.as_list()
+            non_one_dim = []
+            for i, dim in enumerate(shape_list):
+                if dim > 1:
+                    non_one_dim.append(i)
+            if not non_one_dim:
+                return 1, 0
+
+            idx = min(int(axis_draw * len(non_one_dim)), len(non_one_dim) - 1)
             partition_axis = non_one_dim[idx]
-        n = int(var.initial_value.shape[partition_axis])
-        for i in range(2, n):
+            n = int(shape_list[partition_axis])
+        for i in range(2, int(n ** 0.5) + 1):
             if n % i == 0:
                 return i, partition_axis
         return n, partition_axis
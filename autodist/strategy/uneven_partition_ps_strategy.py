@@ -14,7 +14,6 @@
 
 """Partitioned PS StrategyBuilder with Greedy Load Balancer."""
 
-from math import ceil
 from tensorflow.python.framework import tensor_shape
 
 from autodist.const import ENV
@@ -51,10 +50,7 @@ class UnevenPartitionedPS(StrategyBuilder):
         expr = Strategy()
 
         # get each variable, generate variable synchronizer config
-        expr.graph_config.replicas.extend([k for k, v in resource_spec.gpu_devices])
-        for k, v in resource_spec.node_cpu_devices.items():
-            if k not in resource_spec.node_gpu_devices:
-                expr.graph_config.replicas.extend(v)
+        self._extend_replicas(expr, resource_spec)
 
         # find all variables
         variables = graph_item.trainable_var_op_to_var.values()
@@ -87,12 +83,14 @@ class UnevenPartitionedPS(StrategyBuilder):
 
         # Determine placement of vars/parts
         sorted_ps = sorted(self.loads, key=self.loads.get)
-        if num_shards > len(self.loads):
+        if num_shards > len(sorted_ps):
             # If there's more shards than servers, round-robin in greedy order
-            sorted_ps = sorted_ps * ceil(num_shards / len(self.loads))
-        min_ps = sorted_ps[0:num_shards]
+            min_ps = [sorted_ps[i % len(sorted_ps)] for i in range(num_shards)]
+        else:
+            min_ps = sorted_ps[0:num_shards]
+        load_per_shard = byte_size_load_fn(var) / num_shards
         for ps in min_ps:
-            self.loads[ps] += byte_size_load_fn(var) / num_shards
+            self.loads[ps] += load_per_shard
 
         # setup node config
         node = strategy_pb2.Strategy.Node()
@@ -106,29 +104,30 @@ class UnevenPartitionedPS(StrategyBuilder):
         else:
             # generate the partitioner config
             shape = var.initial_value.shape
-            partition_list = [1] * len(var.initial_value.shape)
+            partition_list = [1] * len(shape)
             partition_axis = 0
             partition_list[partition_axis] = min(num_shards, shape.dims[partition_axis].value)
             pc = PartitionerConfig(partition_list=partition_list)
             node.partitioner = pc.partition_str
 
+            var_op_name = get_op_name(var.name)
             for i in range(num_shards):
-                part = strategy_pb2.Strategy.Node()
-                part.var_name = '{}/part_{}:0'.format(get_op_name(var.name), i)
+                part = node.part_config.add()
+                part.var_name = '{}/part_{}:0'.format(var_op_name, i)
                 part.PSSynchronizer.reduction_destination = min_ps[i]
                 part.PSSynchronizer.local_replication = self._local_proxy_variable
                 part.PSSynchronizer.sync = self._sync
                 part.PSSynchronizer.staleness = self._staleness
-                node.part_config.extend([part])
         return node
 
     @staticmethod
     def get_num_shards(var):
         """Gets the minimum number of shards for a variable."""
-        if not var.initial_value.shape.ndims:
+        shape = var.initial_value.shape
+        if not shape.ndims:
             return 1
 
-        n = int(var.initial_value.shape[0])
+        n = int(shape[0])
         for i in range(2, n):
             if n % i > 0:
                 return i